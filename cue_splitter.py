@@ -9,22 +9,33 @@ Example:
     python cue_splitter.py ~/Music/downloads ~/Music/library
 """
 import argparse
+import functools
+import os
 import re
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import NamedTuple, Optional, List, Tuple
 
 
-# Regex patterns
-FILE_RE = re.compile(r'^\s*FILE\s+"([^"]+)"\s+(\S+)\s*$', re.IGNORECASE)
-TRACK_RE = re.compile(r'^\s*TRACK\s+\d+\s+AUDIO\s*$', re.IGNORECASE)
-PERFORMER_RE = re.compile(r'^\s*PERFORMER\s+"([^"]+)"\s*$', re.IGNORECASE)
-TITLE_RE = re.compile(r'^\s*TITLE\s+"([^"]+)"\s*$', re.IGNORECASE)
+# All interesting CUE lines in one pattern, applied to the whole file
+# text so a single linear scan replaces per-line matching.
+COMBINED_RE = re.compile(
+    r'^[ \t]*(?:'
+    r'FILE[ \t]+"([^"]+)"[ \t]+\S+'
+    r'|TRACK[ \t]+\d+[ \t]+AUDIO'
+    r'|PERFORMER[ \t]+"([^"]+)"'
+    r'|TITLE[ \t]+"([^"]+)"'
+    r')[ \t\r]*$',
+    re.IGNORECASE | re.ASCII | re.MULTILINE,
+)
 
 # Audio file extensions
 AUDIO_EXTS = {".flac", ".wav"}
+_AUDIO_EXT_NAMES = frozenset(ext.lstrip(".") for ext in AUDIO_EXTS)
 
 # Transliteration map to match flacsplit sanitize() behavior.
 LATIN_MAP = [
@@ -85,18 +96,134 @@ LATIN_MAP_BEGIN = 0xC0
 LATIN_MAP_END = LATIN_MAP_BEGIN + len(LATIN_MAP)
 
 
+def _build_sanitize_table() -> Tuple[str, ...]:
+    """
+    Build a direct codepoint -> output lookup table for sanitize_name.
+    Index c holds the exact replacement: "" to drop, the character
+    itself to keep, a LATIN_MAP transliteration, or " " for tab.
+    """
+    table = [""] * LATIN_MAP_END
+    for code in range(0x30, 0x3A):  # 0-9
+        table[code] = chr(code)
+    for code in range(0x41, 0x5B):  # A-Z
+        table[code] = chr(code)
+    for code in range(0x61, 0x7B):  # a-z
+        table[code] = chr(code)
+    table[0x20] = " "
+    table[0x09] = " "
+    for offset, mapped in enumerate(LATIN_MAP):
+        if mapped:
+            table[LATIN_MAP_BEGIN + offset] = mapped
+    return tuple(table)
+
+
+_SANITIZE_TABLE = _build_sanitize_table()
+
+# Codepoints whose transliteration is a digraph with a guessed-uppercase
+# second letter (e.g. AE, DH) that may need lowercasing in context.
+_GUESSED_CODES = frozenset(
+    code for code in range(LATIN_MAP_BEGIN, LATIN_MAP_END)
+    if len(_SANITIZE_TABLE[code]) >= 2 and _SANITIZE_TABLE[code][1].isupper()
+)
+_GUESSED_CHARS = frozenset(chr(code) for code in _GUESSED_CODES)
+
+
+class _TranslateTable(dict):
+    """str.translate table that deletes any unmapped codepoint."""
+
+    def __missing__(self, code):
+        return None
+
+
+_TRANS = _TranslateTable(
+    (code, mapped or None) for code, mapped in enumerate(_SANITIZE_TABLE)
+)
+
+
 def read_text_guessing(path: Path) -> str:
-    """Try common encodings for CUE files to handle various encodings."""
+    """
+    Decode a CUE file, sniffing the BOM first so the common cases take a
+    single decode instead of trying every codec in turn.
+    """
     raw = path.read_bytes()
-    for enc in ("utf-8-sig", "utf-16", "utf-16le", "utf-16be", "cp1251", "latin-1"):
+
+    # Fast path: most CUEs are pure ASCII, which a tight strict decode
+    # handles with no BOM checks or codec guessing at all.
+    try:
+        return raw.decode("ascii")
+    except UnicodeDecodeError:
+        pass
+
+    try:
+        if raw.startswith(b"\xEF\xBB\xBF"):
+            return raw.decode("utf-8-sig")
+        if raw.startswith((b"\xFF\xFE", b"\xFE\xFF")):
+            return raw.decode("utf-16")
         try:
-            text = raw.decode(enc, errors="strict")
-            if "\uFFFD" not in text:  # No replacement characters
-                return text
+            return raw.decode("utf-8")
         except UnicodeDecodeError:
-            continue
-    # Fallback: decode with replacement
-    return raw.decode("utf-8", errors="replace")
+            return raw.decode("cp1251")
+    except UnicodeDecodeError:
+        # latin-1 maps every byte, so this cannot fail.
+        return raw.decode("latin-1")
+
+
+class CueData(NamedTuple):
+    """Everything we extract from a CUE file in one parse."""
+    files: List[str]
+    artist: Optional[str]
+    album: Optional[str]
+    track_count: int
+
+
+@functools.lru_cache(maxsize=None)
+def _cue_data(path_str: str, mtime_ns: int, size: int) -> CueData:
+    """
+    Read and parse a CUE file once, extracting FILE references,
+    album-level PERFORMER/TITLE and the TRACK count in a single
+    COMBINED_RE scan over the decoded text (no splitlines allocation).
+    Cached by (path, mtime_ns, size) so untouched files hit the cache
+    while any edit invalidates the entry.
+    """
+    text = read_text_guessing(Path(path_str))
+
+    files = []
+    artist = None
+    album = None
+    track_count = 0
+    in_tracks = False
+
+    # m.lastindex identifies the alternative that matched: 1 = FILE,
+    # 2 = PERFORMER, 3 = TITLE, None = TRACK (no capture group).
+    for m in COMBINED_RE.finditer(text):
+        idx = m.lastindex
+        if idx == 1:
+            files.append(m.group(1).strip())
+        elif idx is None:
+            track_count += 1
+            in_tracks = True
+        elif not in_tracks:
+            if idx == 2:
+                if artist is None:
+                    artist = m.group(2).strip()
+            elif album is None:
+                album = m.group(3).strip()
+
+    return CueData(files, artist, album, track_count)
+
+
+def parse_cue(cue: Path) -> CueData:
+    """Return the cached parse of a CUE file (may raise on I/O errors)."""
+    st = cue.stat()
+    return _cue_data(str(cue), st.st_mtime_ns, st.st_size)
+
+
+def _warm_parse_cache(cue: Path) -> None:
+    """Prefetch one CUE parse; errors are left for the accessors."""
+    try:
+        parse_cue(cue)
+    except Exception:
+        pass
 
 
 def parse_cue_files(cue: Path) -> List[Path]:
@@ -105,61 +232,61 @@ def parse_cue_files(cue: Path) -> List[Path]:
     Resolves relative paths relative to CUE directory.
     """
     try:
-        text = read_text_guessing(cue).splitlines()
+        data = parse_cue(cue)
     except Exception:
         return []
 
     refs = []
     seen = set()
-    
-    for line in text:
-        match = FILE_RE.match(line)
-        if not match:
-            continue
-        
-        fname = match.group(1).strip()
+
+    for fname in data.files:
         ref = Path(fname)
-        
-        # Resolve relative paths
+
+        # Resolve relative paths with pure string math; full symlink
+        # resolution is unnecessary for existence checks and dedup.
         if not ref.is_absolute():
-            ref = (cue.parent / ref).resolve()
-        
+            ref = Path(os.path.normpath(str(cue.parent / ref)))
+
         # Deduplicate
         ref_str = str(ref)
         if ref_str not in seen:
             seen.add(ref_str)
             refs.append(ref)
-    
+
     return refs
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_name(value: str) -> str:
     """Transliterate a Latin-based UTF-8 string to ASCII like flacsplit."""
     if value == "( )":
         return "Untitled"
 
-    result_chars = []
+    # Fast path: without any guessed-case digraph source the whole
+    # transliteration is a context-free mapping, done in C by translate.
+    if _GUESSED_CHARS.isdisjoint(value):
+        return value.translate(_TRANS)
+
+    out = []
     guessed_indexes = []
 
-    for ch in value:
-        code = ord(ch)
-        if ("0" <= ch <= "9") or ch == " " or ("A" <= ch <= "Z") or ("a" <= ch <= "z"):
-            result_chars.append(ch)
-        elif ch == "\t":
-            result_chars.append(" ")
-        elif LATIN_MAP_BEGIN <= code < LATIN_MAP_END:
-            mapped = LATIN_MAP[code - LATIN_MAP_BEGIN]
+    # map(ord, ...) keeps the codepoint iteration in C instead of a
+    # per-character ord() call in the loop body.
+    for code in map(ord, value):
+        if code < LATIN_MAP_END:
+            mapped = _SANITIZE_TABLE[code]
             if mapped:
-                result_chars.extend(mapped)
-                if len(mapped) >= 2 and mapped[1].isupper():
-                    guessed_indexes.append(len(result_chars) - 1)
+                out.append(mapped)
+                if code in _GUESSED_CODES:
+                    guessed_indexes.append(len(out) - 1)
         # Ignore all other characters.
 
-    for idx in guessed_indexes:
-        if idx != len(result_chars) - 1 and not result_chars[idx + 1].isupper():
-            result_chars[idx] = result_chars[idx].lower()
+    if guessed_indexes:
+        for idx in guessed_indexes:
+            if idx != len(out) - 1 and not out[idx + 1][0].isupper():
+                out[idx] = out[idx][0] + out[idx][1].lower()
 
-    return "".join(result_chars)
+    return "".join(out)
 
 
 def parse_cue_artist_album(cue: Path) -> Tuple[Optional[str], Optional[str]]:
@@ -168,28 +295,11 @@ def parse_cue_artist_album(cue: Path) -> Tuple[Optional[str], Optional[str]]:
     Returns (artist, album) or (None, None) when not found.
     """
     try:
-        lines = read_text_guessing(cue).splitlines()
+        data = parse_cue(cue)
     except Exception:
         return None, None
 
-    artist = None
-    album = None
-
-    for line in lines:
-        if TRACK_RE.match(line):
-            break
-        if artist is None:
-            m = PERFORMER_RE.match(line)
-            if m:
-                artist = m.group(1).strip()
-                continue
-        if album is None:
-            m = TITLE_RE.match(line)
-            if m:
-                album = m.group(1).strip()
-                continue
-
-    return artist, album
+    return data.artist, data.album
 
 
 def candidate_artist_album(artist: str, album: str) -> List[Tuple[str, str]]:
@@ -202,25 +312,55 @@ def candidate_artist_album(artist: str, album: str) -> List[Tuple[str, str]]:
 def count_cue_tracks(cue: Path) -> int:
     """Count number of TRACK entries in CUE file."""
     try:
-        text = read_text_guessing(cue).splitlines()
+        return parse_cue(cue).track_count
     except Exception:
         return 0
-    
-    return sum(1 for line in text if TRACK_RE.match(line))
 
 
-def count_audio_files(directory: Path) -> int:
-    """Count audio files in a directory."""
-    if not directory.exists():
+def iter_cues(root: Path):
+    """
+    Yield all .cue files (any case) under root in a single os.scandir
+    walk, avoiding the extra stat calls and double traversal of rglob.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name[-4:].lower() == ".cue" and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
+@functools.lru_cache(maxsize=None)
+def _count_audio_files(dir_str: str, mtime_ns: int) -> int:
+    try:
+        with os.scandir(dir_str) as it:
+            return sum(
+                1 for e in it
+                if e.is_file(follow_symlinks=False)
+                and e.name.rpartition(".")[0]
+                and e.name.rpartition(".")[2].lower() in _AUDIO_EXT_NAMES
+            )
+    except OSError:
         return 0
-    
+
+
+def count_audio_files(directory: Path) -> int:
+    """
+    Count audio files in a directory, cached by (path, mtime) so the
+    enumeration is skipped when the directory has not changed. Splitting
+    into a directory updates its mtime, which invalidates the entry.
+    """
     try:
-        return sum(
-            1 for p in directory.iterdir()
-            if p.is_file() and p.suffix.lower() in AUDIO_EXTS
-        )
-    except Exception:
+        mtime_ns = directory.stat().st_mtime_ns
+    except OSError:
         return 0
+    return _count_audio_files(str(directory), mtime_ns)
 
 
 def find_audio_file(refs: List[Path]) -> Optional[Path]:
@@ -230,6 +370,21 @@ def find_audio_file(refs: List[Path]) -> Optional[Path]:
     return None
 
 
+def rel_or_none(path: Path, root: Path) -> Optional[Path]:
+    """
+    Return path relative to root, or None when path is not under root.
+    A plain string-prefix check; cheaper than catching the ValueError
+    that Path.relative_to raises on the fallback case.
+    """
+    s_path = str(path)
+    s_root = str(root)
+    if s_path == s_root:
+        return Path(".")
+    if s_path.startswith(s_root + os.sep):
+        return Path(s_path[len(s_root) + 1:])
+    return None
+
+
 def output_release_dir(cue: Path, basedir: Path, outdir: Path) -> Path:
     """
     Determine output directory as {outdir}/{artist}/{album}.
@@ -239,19 +394,17 @@ def output_release_dir(cue: Path, basedir: Path, outdir: Path) -> Path:
     if artist is not None or album is not None:
         artist_value = artist or ""
         album_value = album or ""
-        for cand_artist, cand_album in candidate_artist_album(artist_value, album_value):
+        candidates = candidate_artist_album(artist_value, album_value)
+        for cand_artist, cand_album in candidates:
             cand_dir = outdir / cand_artist / cand_album
             if cand_dir.exists():
                 return cand_dir
-        sanitized_artist = sanitize_name(artist_value)
-        sanitized_album = sanitize_name(album_value) if album_value else "no album"
+        sanitized_artist, sanitized_album = candidates[0]
         return outdir / sanitized_artist / sanitized_album
 
-    try:
-        rel_parent = cue.parent.relative_to(basedir)
+    rel_parent = rel_or_none(cue.parent, basedir)
+    if rel_parent is not None:
         return outdir / rel_parent
-    except ValueError:
-        pass
 
     return outdir / cue.parent.name
 
@@ -272,13 +425,15 @@ def run_flacsplit(cue: Path, out_root: Path, resample: int, dry_run: bool) -> No
     # Create output directory
     out_root.mkdir(parents=True, exist_ok=True)
 
-    # Run flacsplit
-    proc = subprocess.run(cmd, capture_output=True, text=True)
+    # Run flacsplit; discard progress output on stdout instead of
+    # buffering it, keeping only stderr for the failure message.
+    proc = subprocess.run(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
 
     if proc.returncode != 0:
         raise RuntimeError(
             f"flacsplit failed with code {proc.returncode}\n"
-            f"STDOUT: {proc.stdout}\n"
             f"STDERR: {proc.stderr}"
         )
 
@@ -290,35 +445,85 @@ def ensure_tools() -> None:
         sys.exit(2)
 
 
-def should_process(cue: Path, out_dir: Path, force: bool) -> Tuple[bool, str]:
+def should_process(cue: Path, out_dir: Path, force: bool) -> Tuple[bool, str, int]:
     """
     Determine if CUE file should be processed.
-    Returns (should_process, reason).
+    Returns (should_process, reason, track_count).
     """
     # Check if CUE has multiple tracks
     track_count = count_cue_tracks(cue)
     if track_count <= 1:
-        return False, "no tracks or only 1 track"
-    
+        return False, "no tracks or only 1 track", track_count
+
     # Check if it's single-file CUE
     refs = parse_cue_files(cue)
     if len(refs) == 0:
-        return False, "no audio file referenced"
+        return False, "no audio file referenced", track_count
     elif len(refs) > 1:
-        return False, "multi-file CUE (already split)"
-    
+        return False, "multi-file CUE (already split)", track_count
+
     # Check if audio file exists
     audio = find_audio_file(refs)
     if not audio:
-        return False, "audio file not found"
-    
+        return False, "audio file not found", track_count
+
     # Check idempotency: compare track counts
     if not force:
         existing_count = count_audio_files(out_dir)
         if existing_count == track_count:
-            return False, f"already processed ({existing_count}/{track_count} tracks)"
-    
-    return True, f"{track_count} tracks"
+            return False, f"already processed ({existing_count}/{track_count} tracks)", track_count
+
+    return True, f"{track_count} tracks", track_count
+
+
+# Serializes stdout/stderr writes from worker threads.
+_print_lock = threading.Lock()
+
+
+def process_one(cue: Path, basedir: Path, outdir: Path, args) -> str:
+    """
+    Handle a single CUE file: decide, split and verify.
+    Returns "processed", "skipped" or "failed" for the summary.
+    """
+    # Determine output directory as {outdir}/{artist}/{album}
+    out_release_dir = output_release_dir(cue, basedir, outdir)
+
+    # Get relative path for display
+    rel_path = rel_or_none(out_release_dir, outdir)
+    if rel_path is None:
+        rel_path = out_release_dir.name
+
+    # Check if should process
+    should_proc, reason, expected_count = should_process(cue, out_release_dir, args.force)
+
+    if not should_proc:
+        with _print_lock:
+            print(f"SKIP: {rel_path} - {reason}")
+        return "skipped"
+
+    # Process
+    with _print_lock:
+        print(f"SPLIT: {rel_path} - {reason}")
+    try:
+        run_flacsplit(cue, outdir, args.resample, args.dry_run)
+
+        # Verify output against the track count from should_process.
+        # Name the release: with --jobs > 1 these lines can interleave
+        # with output for other CUEs.
+        if not args.dry_run:
+            result_count = count_audio_files(out_release_dir)
+            with _print_lock:
+                if result_count < expected_count:
+                    print(f"  WARNING: {rel_path}: Expected {expected_count} tracks, got {result_count}")
+                else:
+                    print(f"  ✓ {rel_path}: Created {result_count} tracks")
+
+        return "processed"
+
+    except Exception as e:
+        with _print_lock:
+            print(f"FAILED: {rel_path} - {e}", file=sys.stderr)
+        return "failed"
 
 
 def main() -> int:
@@ -355,12 +560,18 @@ Examples:
         action="store_true",
         help="Force re-splitting even if output exists"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of CUE files to split in parallel (default: CPU count)"
+    )
     
     args = parser.parse_args()
     
-    # Resolve paths
-    basedir = Path(args.basedir).expanduser().resolve()
-    outdir = Path(args.outdir).expanduser().resolve()
+    # Absolutize paths; plain string math, no symlink resolution needed.
+    basedir = Path(os.path.abspath(os.path.expanduser(args.basedir)))
+    outdir = Path(os.path.abspath(os.path.expanduser(args.outdir)))
     
     # Check required tools
     ensure_tools()
@@ -376,56 +587,35 @@ Examples:
     
     # Find all CUE files
     print(f"Scanning {basedir} for CUE files...")
-    cues = sorted(basedir.rglob("*.cue")) + sorted(basedir.rglob("*.CUE"))
+    cues = sorted(iter_cues(basedir))
     
     if not cues:
         print(f"No CUE files found in {basedir}")
         return 0
     
     print(f"Found {len(cues)} CUE file(s)\n")
-    
+
+    # Warm the parse cache in parallel before dispatching: on libraries
+    # where most CUEs get skipped, runtime is dominated by reading and
+    # decoding them, and threads overlap that I/O across files.
+    with ThreadPoolExecutor(max_workers=8) as prefetcher:
+        for _ in prefetcher.map(_warm_parse_cache, cues):
+            pass
+
     # Statistics
     stats = {"processed": 0, "skipped": 0, "failed": 0}
-    
-    # Process each CUE file
-    for cue in cues:
-        # Determine output directory as {outdir}/{artist}/{album}
-        out_release_dir = output_release_dir(cue, basedir, outdir)
 
-        # Get relative path for display
-        try:
-            rel_path = out_release_dir.relative_to(outdir)
-        except ValueError:
-            rel_path = out_release_dir.name
-        
-        # Check if should process
-        should_proc, reason = should_process(cue, out_release_dir, args.force)
-        
-        if not should_proc:
-            print(f"SKIP: {rel_path} - {reason}")
-            stats["skipped"] += 1
-            continue
-        
-        # Process
-        print(f"SPLIT: {rel_path} - {reason}")
-        try:
-            run_flacsplit(cue, outdir, args.resample, args.dry_run)
-            
-            # Verify output
-            if not args.dry_run:
-                result_count = count_audio_files(out_release_dir)
-                expected_count = count_cue_tracks(cue)
-                if result_count < expected_count:
-                    print(f"  WARNING: Expected {expected_count} tracks, got {result_count}")
-                else:
-                    print(f"  ✓ Created {result_count} tracks")
-            
-            stats["processed"] += 1
-            
-        except Exception as e:
-            print(f"FAILED: {rel_path} - {e}", file=sys.stderr)
-            stats["failed"] += 1
-    
+    # Process CUE files in parallel; each flacsplit run is an independent
+    # external process, so threads are enough to keep all cores busy.
+    max_workers = max(1, args.jobs or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(process_one, cue, basedir, outdir, args)
+            for cue in cues
+        ]
+        for future in as_completed(futures):
+            stats[future.result()] += 1
+
     # Summary
     print(f"\n{'='*60}")
     print(f"Summary: {stats['processed']} processed, {stats['skipped']} skipped, {stats['failed']} failed")